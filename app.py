@@ -1,6 +1,7 @@
 import streamlit as st
 
 from utils import loader, calculos, ui
+from utils.geotools import simplificar_geometrias
 
 
 # ------ Configuración de Streamlit ------
@@ -14,10 +15,57 @@ st.set_page_config(
 st.markdown("""<h1 style='text-align:center'>🗳️ Simulador Electoral PBA</h1>""", unsafe_allow_html=True)
 
 # ------ Carga de datos: el año vigente se lee de config.ini por defecto. ------
-@st.cache_data(show_spinner=False)
-def build_context(alianzas_visibles: list[str]):
+@st.cache_resource(show_spinner=False)
+def cargar_congreso():
+    """Carga el Congreso una sola vez por proceso (objeto compartido, no mutar)."""
+    return loader.cargar_congreso(None)
+
+@st.cache_resource(show_spinner=False)
+def cargar_secciones():
+    """Polígonos de las secciones, compartidos por todas las sesiones (no mutar).
+
+    Se simplifican una sola vez acá: los mapas sólo muestran la provincia
+    entera y el detalle original no se llega a ver.
+    """
+    return simplificar_geometrias(loader.cargar_secciones_geojson())
+
+@st.cache_resource(show_spinner=False)
+def cargar_tablas_por_seccion():
+    """Datos fijos del proceso: padrón total, totales no renovados y matrices sección × alianza."""
+    congreso = cargar_congreso()
+    camaras = ("diputados", "senadores")
+    no_renuevan = congreso.obtener_bancas_no_disputadas()
+    return dict(
+        PADRON_TOTAL=sum(congreso.obtener_padron().values()),
+        NO_RENUEVAN_TOTALES={c: calculos.totalizar_no_renovadas(no_renuevan[c]) for c in camaras},
+        SEGURAS={c: calculos.tabla_por_seccion(no_renuevan[c], congreso.partido_a_alianza)
+                 for c in camaras},
+        VIEJAS={c: calculos.tabla_por_seccion(congreso.obtener_composicion_actual()[c],
+                                              congreso.partido_a_alianza) for c in camaras},
+    )
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def calcular_bancas_nuevas(creencias_global: dict, creencias_por_seccion: dict | None,
+                           participacion: float, votos_validos_pct: float, _ctx: dict):
+    """Bancas nuevas por cámara, memoizadas por creencias y parámetros.
+
+    ``_ctx`` no entra en la clave de caché: sus datos son fijos en el proceso.
+    """
+    datos = (
+        _ctx["SECCIONES_DIPUTADOS"],
+        _ctx["SECCIONES_SENADORES"],
+        _ctx["PADRON_REAL"],
+        _ctx["SECCIONES_X_ALIANZA"],
+        participacion,
+        votos_validos_pct,
+    )
+    if creencias_por_seccion:
+        return calculos.calcular_determinista_por_seccion(creencias_por_seccion, *datos)
+    return calculos.calcular_determinista(creencias_global, *datos)
+
+def build_context():
     """Construye el contexto completo con todos los datos necesarios."""
-    congreso = loader.cargar_congreso(None)
+    congreso = cargar_congreso()
 
     padron = congreso.obtener_padron()
     bancas = congreso.obtener_bancas_por_seccion()["a_elegir_2025"]
@@ -29,9 +77,9 @@ def build_context(alianzas_visibles: list[str]):
         SECCIONES_SENADORES=bancas["senadores"],
         COLORES_PARTIDOS=congreso.obtener_colores_alianzas(),
         SECCIONES_X_ALIANZA=congreso.obtener_secciones_por_alianza(),
-        BANCAS_NO_RENUEVAN=congreso.obtener_bancas_no_disputadas(),
-        GDF_SECCIONES=loader.cargar_secciones_geojson(),
+        GDF_SECCIONES=cargar_secciones(),
         EPSG_PROJ=loader.leer_epsg_proyectado(),
+        **cargar_tablas_por_seccion(),
     )
 
 # ------ Configuración inicial ------
@@ -42,9 +90,9 @@ ALIANZAS_RECOMENDADAS = [
     "Alianza FIT-U",
 ]
 
-ctx_tmp = build_context([])  # TEMPORAL → usar build_context sólo para obtener estructura y padrón
-SECCIONES_X_ALIANZA = ctx_tmp["SECCIONES_X_ALIANZA"]
-PADRON_REAL = ctx_tmp["PADRON_REAL"]
+ctx = build_context()  # No depende de las alianzas elegidas: se arma una vez por rerun
+SECCIONES_X_ALIANZA = ctx["SECCIONES_X_ALIANZA"]
+PADRON_REAL = ctx["PADRON_REAL"]
 
 ALIANZAS_GLOBALES = [
     a for a, secciones in SECCIONES_X_ALIANZA.items()
@@ -62,14 +110,12 @@ alianzas_visibles, configuracion = ui.configurar_sidebar(
     PADRON_REAL
 )
 
-ctx = build_context(alianzas_visibles)  # Construir contexto con alianzas seleccionadas
-
 # Configurar intenciones de voto
 creencias_global, creencias_por_seccion = ui.configurar_intenciones_voto(
     alianzas_visibles,
-    configuracion['cfg_seccion'],
-    ctx["PADRON_REAL"],
-    ctx["SECCIONES_X_ALIANZA"]
+    configuracion['secciones_personalizadas'],
+    ctx["SECCIONES_X_ALIANZA"],
+    configuracion['form']
 )
 
 # Extraer configuración
@@ -81,44 +127,34 @@ votos_validos_pct = configuracion['votos_validos_pct']
 total_pct = sum(creencias_global.values())
 
 # Renderizar botón de ejecución
-if ui.renderizar_boton_ejecutar(total_pct):
+if ui.renderizar_boton_ejecutar(total_pct, configuracion['form']):
     
     # Cálculo determinista
-    if cfg_seccion and creencias_por_seccion:
-        dip_nuevas, sen_nuevas = calculos.calcular_determinista_por_seccion(
-            creencias_por_seccion,
-            ctx["SECCIONES_DIPUTADOS"],
-            ctx["SECCIONES_SENADORES"],
-            ctx["PADRON_REAL"],
-            ctx["SECCIONES_X_ALIANZA"],
-            participacion,
-            votos_validos_pct,
-        )
-    else:
-        dip_nuevas, sen_nuevas = calculos.calcular_determinista(
-            creencias_global,
-            ctx["SECCIONES_DIPUTADOS"],
-            ctx["SECCIONES_SENADORES"],
-            ctx["PADRON_REAL"],
-            ctx["SECCIONES_X_ALIANZA"],
-            participacion,
-            votos_validos_pct,
-        )
+    dip_nuevas, sen_nuevas = calcular_bancas_nuevas(
+        creencias_global,
+        creencias_por_seccion if cfg_seccion else None,
+        participacion,
+        votos_validos_pct,
+        ctx,
+    )
 
     # Suma bancas no renovadas
     dip_final = calculos.agregar_bancas_no_renovadas(
         dip_nuevas.groupby("lista").bancas.sum(), 
-        ctx["BANCAS_NO_RENUEVAN"]["diputados"]
+        ctx["NO_RENUEVAN_TOTALES"]["diputados"]
     )
     sen_final = calculos.agregar_bancas_no_renovadas(
         sen_nuevas.groupby("lista").bancas.sum(), 
-        ctx["BANCAS_NO_RENUEVAN"]["senadores"]
+        ctx["NO_RENUEVAN_TOTALES"]["senadores"]
     )
 
     # Guardar en session_state
     st.session_state.resultados = {
         "dip_final": dip_final,
         "sen_final": sen_final,
+        # Tablas del resumen, armadas una sola vez por ejecución
+        "dip_final_df": dip_final[dip_final > 0].to_frame("Bancas"),
+        "sen_final_df": sen_final[sen_final > 0].to_frame("Bancas"),
         "dip_nuevas": dip_nuevas,
         "sen_nuevas": sen_nuevas,
         "participacion": participacion,
@@ -133,6 +169,9 @@ if "resultados" in st.session_state:
         res["dip_final"], 
         res["sen_final"], 
         ctx=ctx,
+        participacion=res["participacion"],
+        votos_validos_pct=res["votos_validos_pct"],
         gdf_secciones=ctx["GDF_SECCIONES"],
+        tablas_resumen=(res["dip_final_df"], res["sen_final_df"]),
         detalles_por_seccion=(res["dip_nuevas"], res["sen_nuevas"])
     )
\ No newline at end of file
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from typing import Dict
 from collections.abc import Callable
@@ -6,90 +7,163 @@ from utils.cuociente import repartir_bancas
 __all__ = [
     "calcular_determinista",
     "calcular_determinista_por_seccion",
-    "agregar_bancas_no_renovadas"
+    "agregar_bancas_no_renovadas",
+    "totalizar_no_renovadas",
+    "tabla_por_seccion"
 ]
 
-def _generar_filas_para_camara(
-    secciones: Dict[str, int],
+def _votos_validos(
     padron_real: Dict[str, int],
-    creencias_seccion: Callable[[str], Dict[str, int]],
     participacion: float,
     votos_validos_pct: float
-) -> list[dict]:
+) -> Dict[str, int]:
+    """
+    Votos válidos por sección (padrón × participación × % válidos,
+    truncados), calculados una sola vez por ejecución para ambas cámaras.
+    """
+    padron = np.fromiter(padron_real.values(), dtype=np.int64, count=len(padron_real))
+    validos = (padron * participacion * votos_validos_pct).astype(np.int64)
+    return dict(zip(padron_real, validos.tolist()))
+
+def _generar_filas_para_camara(
+    secciones: Dict[str, int],
+    votos_validos: Dict[str, int],
+    creencias_seccion: Dict[str, Dict[str, int]],
+    secciones_x_alianza: Dict[str, set]
+) -> pd.DataFrame:
     """
-    Genera las filas de datos que servirán de entrada a ``repartir_bancas``.
+    Genera la tabla de entrada de ``repartir_bancas``.
+
+    Los votos de todas las filas se calculan de una sola vez sobre
+    arreglos de NumPy alineados (votos válidos y ``cargos`` por sección,
+    porcentaje por fila) en lugar de construir un ``dict`` por fila.
 
     Parameters
     ----------
     secciones : dict[str, int]
         Mapeo *sección → cantidad de cargos* que se ponen en juego
         en la cámara correspondiente.
-    padron_real : dict[str, int]
-        Mapeo *sección → cantidad de electores* (padrón habilitado).
-    creencias_seccion : Callable[[str], dict[str, int]]
-        Función que, dado el nombre de la sección, devuelve las
-        creencias porcentuales ``alianza → %`` (0‒100) **ya filtradas**
-        para las alianzas que compiten allí.
-    participacion : float
-        Proporción de participación sobre el padrón habilitado
-        (valor entre 0 y 1).
-    votos_validos_pct : float
-        Proporción de votos válidos sobre los sufragios emitidos
-        (valor entre 0 y 1).
+    votos_validos : dict[str, int]
+        Mapeo *sección → votos válidos* (ver ``_votos_validos``).
+    creencias_seccion : dict[str, dict[str, int]]
+        Mapeo *sección → creencias porcentuales* ``alianza → %`` (0‒100)
+        que se aplican allí, **sin filtrar** por las alianzas que compiten.
+    secciones_x_alianza : dict[str, set[str]]
+        Mapeo «alianza → conjunto de secciones donde efectivamente compite».
 
     Returns
     -------
-    list[dict]
-        Cada elemento tiene las claves:
-        ``{"seccion", "lista", "votos", "cargos"}``.
-    """
-    filas = []
-    for seccion, cargos in secciones.items():
-        pad = padron_real[seccion]
-        validos = int(pad * participacion * votos_validos_pct)
-        for alianza, pct in creencias_seccion(seccion).items():
-            filas.append(
-                dict(seccion=seccion, lista=alianza,
-                     votos=int(validos * pct / 100), cargos=cargos)
-            )
-        if not filas:
-            filas.append(dict(seccion=seccion, lista="Ninguna", votos=0, cargos=cargos))
-    return filas
-
-def _normalizar_creencias_para_seccion(
-    creencias: Dict[str, int], 
-    seccion: str, 
+    pandas.DataFrame
+        Una fila por (sección, alianza que compite) con las columnas
+        ``["seccion", "lista", "votos", "cargos"]``.  Las secciones en
+        las que no compite ninguna alianza no generan filas.
+    """
+    nombres = np.array(list(secciones), dtype=object)
+    cargos = np.fromiter(secciones.values(), dtype=np.int64, count=len(nombres))
+    validos = np.fromiter((votos_validos[s] for s in nombres), dtype=np.int64, count=len(nombres))
+
+    creencias = [creencias_seccion[s] for s in nombres]
+    n_listas = np.fromiter(map(len, creencias), dtype=np.int64, count=len(nombres))
+    listas = np.array([a for c in creencias for a in c], dtype=object)
+    pct = np.fromiter((p for c in creencias for p in c.values()), dtype=np.float64, count=n_listas.sum())
+    fila_seccion = np.repeat(np.arange(len(nombres)), n_listas)
+
+    validas, pct = _normalizar_creencias(fila_seccion, listas, pct, nombres, secciones_x_alianza)
+    fila_seccion = fila_seccion[validas]
+
+    return pd.DataFrame({
+        "seccion": nombres[fila_seccion],
+        "lista": listas[validas],
+        "votos": (validos[fila_seccion] * pct / 100).astype(np.int64),
+        "cargos": cargos[fila_seccion],
+    })
+
+def _matriz_competencia(
+    secciones: np.ndarray,
+    alianzas: np.ndarray,
+    secciones_x_alianza: Dict[str, set]
+) -> np.ndarray:
+    """
+    Matriz booleana ``compite[i, j]``: la alianza ``j`` compite en la
+    sección ``i``.  Las alianzas ausentes de ``secciones_x_alianza``
+    no compiten en ninguna.
+    """
+    compite = np.zeros((len(secciones), len(alianzas)), dtype=bool)
+    for j, alianza in enumerate(alianzas):
+        donde = secciones_x_alianza.get(alianza, ())
+        compite[:, j] = [s in donde for s in secciones]
+    return compite
+
+def _normalizar_creencias(
+    fila_seccion: np.ndarray,
+    listas: np.ndarray,
+    pct: np.ndarray,
+    secciones: np.ndarray,
     secciones_x_alianza: Dict[str, set]
-) -> Dict[str, float]:
+) -> tuple[np.ndarray, np.ndarray]:
     """
-    Re‑escala las creencias para que sumen 100 % en la sección indicada.
+    Re‑escala las creencias para que sumen 100 % en cada sección.
 
-    Las alianzas que no compiten allí se descartan antes de normalizar.
+    Las alianzas que no compiten en la sección de su fila se descartan
+    antes de normalizar, usando una sola matriz de pertenencia en lugar
+    de consultar ``secciones_x_alianza`` fila por fila.
 
     Parameters
     ----------
-    creencias : dict[str, int]
-        Intención de voto global «alianza → %» antes de filtrar por sección.
-    seccion : str
-        Sección electoral a la que se aplica el filtro.
+    fila_seccion : numpy.ndarray
+        Índice (en ``secciones``) de la sección de cada fila.
+    listas : numpy.ndarray
+        Alianza de cada fila.
+    pct : numpy.ndarray
+        Intención de voto «%» de cada fila antes de filtrar.
+    secciones : numpy.ndarray
+        Nombres de las secciones de la cámara.
     secciones_x_alianza : dict[str, set[str]]
         Mapeo «alianza → conjunto de secciones donde efectivamente compite».
 
     Returns
     -------
-    dict[str, float]
-        Intención de voto re‑normalizada (0‒100) sólo para las
-        alianzas válidas en la sección.  Devuelve un diccionario
-        vacío si ninguna alianza compite allí.
+    (numpy.ndarray, numpy.ndarray)
+        Máscara de las filas válidas y su intención de voto
+        re‑normalizada (0‒100).  Una sección queda sin filas válidas
+        si ninguna de sus alianzas compite allí o si todas suman 0 %.
     """
-    alianzas_validas = {
-        a: pct for a, pct in creencias.items()
-        if a in secciones_x_alianza and seccion in secciones_x_alianza[a]
-    }
-    total = sum(alianzas_validas.values())
-    if total == 0:
-        return {}
-    return {a: 100 * v / total for a, v in alianzas_validas.items()}
+    codigos, alianzas = pd.factorize(listas)
+    compite = _matriz_competencia(secciones, alianzas, secciones_x_alianza)
+    validas = compite[fila_seccion, codigos]
+
+    total = np.bincount(fila_seccion[validas], weights=pct[validas], minlength=len(secciones))
+    validas &= total[fila_seccion] > 0
+    return validas, 100 * pct[validas] / total[fila_seccion[validas]]
+
+
+def _repartir_camaras(
+    camaras: tuple[Dict[str, int], ...],
+    padron_real: Dict[str, int],
+    creencias_seccion: Callable[[str], Dict[str, int]],
+    secciones_x_alianza: Dict[str, set],
+    participacion: float,
+    votos_validos_pct: float
+) -> tuple[pd.DataFrame, ...]:
+    """
+    Reparte las bancas de cada cámara de ``camaras`` con las mismas
+    creencias y los mismos votos válidos, calculados una sola vez.
+
+    Devuelve un DataFrame de ``repartir_bancas`` por cámara, en el
+    mismo orden recibido.
+    """
+    votos_validos = _votos_validos(padron_real, participacion, votos_validos_pct)
+
+    # Las creencias de cada sección se resuelven una sola vez, aunque la
+    # sección elija cargos en ambas cámaras
+    creencias = {s: creencias_seccion(s) for camara in camaras for s in camara}
+
+    return tuple(
+        repartir_bancas(_generar_filas_para_camara(
+            secciones, votos_validos, creencias, secciones_x_alianza
+        ))
+        for secciones in camaras
+    )
 
 
 def calcular_determinista(
@@ -127,22 +201,13 @@ def calcular_determinista(
         ``["seccion", "lista", "votos", "bancas"]``.
     """
     def _creencias_func(seccion):
-        return _normalizar_creencias_para_seccion(
-            creencias_global, seccion, secciones_x_alianza
-        )
+        return creencias_global
 
-    filas_dip = _generar_filas_para_camara(
-        secciones_diputados, padron_real, _creencias_func, participacion, votos_validos_pct
-    )
-    filas_sen = _generar_filas_para_camara(
-        secciones_senadores, padron_real, _creencias_func, participacion, votos_validos_pct
+    return _repartir_camaras(
+        (secciones_diputados, secciones_senadores), padron_real, _creencias_func,
+        secciones_x_alianza, participacion, votos_validos_pct
     )
 
-    dip = repartir_bancas(pd.DataFrame(filas_dip))
-    sen = repartir_bancas(pd.DataFrame(filas_sen))
-
-    return dip, sen
-
 
 def calcular_determinista_por_seccion(
     creencias_por_seccion: Dict[str, Dict[str, int]],
@@ -183,27 +248,39 @@ def calcular_determinista_por_seccion(
         ``["seccion", "lista", "votos", "bancas"]``.
     """
     def _creencias_func(seccion):
-        base = creencias_por_seccion.get(seccion, creencias_por_seccion["global"])
-        return _normalizar_creencias_para_seccion(
-            base, seccion, secciones_x_alianza
-        )
+        return creencias_por_seccion.get(seccion, creencias_por_seccion["global"])
 
-    filas_dip = _generar_filas_para_camara(
-        secciones_diputados, padron_real, _creencias_func, participacion, votos_validos_pct
-    )
-    filas_sen = _generar_filas_para_camara(
-        secciones_senadores, padron_real, _creencias_func, participacion, votos_validos_pct
+    return _repartir_camaras(
+        (secciones_diputados, secciones_senadores), padron_real, _creencias_func,
+        secciones_x_alianza, participacion, votos_validos_pct
     )
 
-    dip = repartir_bancas(pd.DataFrame(filas_dip))
-    sen = repartir_bancas(pd.DataFrame(filas_sen))
 
-    return dip, sen
+def totalizar_no_renovadas(no_renuevan: Dict[str, Dict[str, int]]) -> pd.Series:
+    """
+    Suma, para toda la provincia, las bancas que no se disputan.
+
+    Parameters
+    ----------
+    no_renuevan : dict[str, dict[str, int]]
+        Mapeo «sección → (alianza → bancas que no concluyen mandato)».
+
+    Returns
+    -------
+    pandas.Series
+        Serie «alianza → bancas no renovadas», de tipo ``int64``.
+        Depende sólo de datos fijos, así que puede calcularse una vez y
+        reutilizarse.
+    """
+    # Las alianzas ausentes en alguna sección dejan NaN: se vuelve a
+    # entero acá, una sola vez, para que la suma con las nuevas no pase
+    # por float
+    return pd.DataFrame.from_dict(no_renuevan, orient="index").sum().astype(np.int64)
 
 
 def agregar_bancas_no_renovadas(
     nuevas: pd.Series, 
-    no_renuevan: Dict[str, Dict[str, int]]
+    no_renuevan: Dict[str, Dict[str, int]] | pd.Series
 ) -> pd.Series:
     """
     Suma las bancas que no se disputan a las recién asignadas.
@@ -212,8 +289,10 @@ def agregar_bancas_no_renovadas(
     ----------
     nuevas : pandas.Series
         Serie «alianza → bancas nuevas».
-    no_renuevan : dict[str, dict[str, int]]
-        Mapeo «sección → (alianza → bancas que no concluyen mandato)».
+    no_renuevan : dict[str, dict[str, int]] | pandas.Series
+        Mapeo «sección → (alianza → bancas que no concluyen mandato)»,
+        o bien su total por alianza ya calculado con
+        ``totalizar_no_renovadas``.
 
     Returns
     -------
@@ -221,8 +300,38 @@ def agregar_bancas_no_renovadas(
         Banca total por alianza (*nuevas + no renovadas*),
         siempre de tipo ``int``.
     """
-    total = nuevas.copy()
-    for _, dic in no_renuevan.items():
-        for alianza, n in dic.items():
-            total[alianza] = total.get(alianza, 0) + n
-    return total.fillna(0).astype(int) 
\ No newline at end of file
+    extra = no_renuevan if isinstance(no_renuevan, pd.Series) else totalizar_no_renovadas(no_renuevan)
+    indice = nuevas.index.union(extra.index, sort=False).rename(nuevas.index.name)
+    total = nuevas.reindex(indice, fill_value=0) + extra.reindex(indice, fill_value=0).to_numpy()
+    return total.astype(np.int64)
+
+
+def tabla_por_seccion(
+    por_seccion: Dict[str, Dict[str, int]],
+    partido_a_alianza: Dict[str, str]
+) -> pd.DataFrame:
+    """
+    Arma la matriz «sección × alianza» de un mapeo anidado de bancas.
+
+    Parameters
+    ----------
+    por_seccion : dict[str, dict[str, int]]
+        Mapeo «sección → (partido o alianza → bancas)», p. ej. las
+        bancas que no se renuevan o la composición actual.
+    partido_a_alianza : dict[str, str]
+        Mapeo «PARTIDO (normalizado) → alianza».  Los nombres que no
+        figuran se dejan como están.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Bancas por sección (filas) y alianza (columnas), sumando los
+        partidos de una misma alianza; las celdas vacías valen 0.
+    """
+    filas = {}
+    for seccion, dic in por_seccion.items():
+        fila = filas[seccion] = {}
+        for partido, n in dic.items():
+            alianza = partido_a_alianza.get(partido.strip().upper(), partido)
+            fila[alianza] = fila.get(alianza, 0) + n
+    return pd.DataFrame.from_dict(filas, orient="index").fillna(0).astype(np.int64)
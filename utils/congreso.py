@@ -1,9 +1,8 @@
 import json
-import pandas as pd
-from collections import defaultdict
+from types import MappingProxyType
+from typing import Mapping
 
-def nested_defaultdict_int():
-    return defaultdict(int)
+import pandas as pd
 
 class Congreso:
     def __init__(self, json_path, csv_path):
@@ -12,8 +11,13 @@ class Congreso:
         self.estructura = estructura
         self.df_composicion = pd.read_csv(csv_path)
         self.partido_a_alianza = self._crear_mapeo_partido_alianza()
-        self.composicion_actual = self._calcular_composicion(solo_no_renueva=False)
-        self.bancas_no_disputadas = self._calcular_composicion(solo_no_renueva=True)
+        composicion = self._normalizar_composicion()
+        self.composicion_actual = self._calcular_composicion(composicion, solo_no_renueva=False)
+        self.bancas_no_disputadas = self._calcular_composicion(composicion, solo_no_renueva=True)
+        # Vistas de sólo lectura: la instancia se comparte entre sesiones
+        self.secciones_por_alianza = MappingProxyType(self._calcular_secciones_por_alianza())
+        self.colores_alianzas = MappingProxyType(
+            {a: v["color"] for a, v in estructura["alianzas"].items()})
 
     def _cargar_json(self, path):
         with open(path, "r", encoding="utf-8") as f:
@@ -29,28 +33,34 @@ class Congreso:
     def _normalizar_partido(self, nombre):
         return nombre.strip().upper()
 
-    def _calcular_composicion(self, solo_no_renueva=False):
-        resultado = {
-            "diputados": defaultdict(nested_defaultdict_int),
-            "senadores": defaultdict(nested_defaultdict_int)
-        }
-
-        for _, row in self.df_composicion.iterrows():
-            if solo_no_renueva and row["renueva"].strip().upper() != "NO":
-                continue
-
-            camara = row["camara"].strip().lower()
-            seccion = row["seccion"].strip()
-            partido = self._normalizar_partido(row["partido_politico"])
-            camara_clave = "diputados" if camara == "diputados" else "senadores"
-            alianza = self.partido_a_alianza.get(partido, partido)
-            resultado[camara_clave][seccion][alianza] += 1
+    def _normalizar_composicion(self):
+        """Columnas de ``df_composicion`` normalizadas de una sola vez."""
+        df = self.df_composicion
+        camara = df["camara"].str.strip().str.lower()
+        partido = df["partido_politico"].str.strip().str.upper()
+        return pd.DataFrame({
+            "camara": camara.where(camara == "diputados", "senadores"),
+            "seccion": df["seccion"].str.strip(),
+            "alianza": partido.map(self.partido_a_alianza).fillna(partido),
+            "no_renueva": df["renueva"].str.strip().str.upper() == "NO",
+        })
+
+    def _calcular_composicion(self, composicion, solo_no_renueva=False):
+        resultado = {"diputados": {}, "senadores": {}}
+
+        if solo_no_renueva:
+            composicion = composicion[composicion["no_renueva"]]
+
+        # Bancas por (cámara, sección, alianza) en orden de aparición
+        conteos = composicion.groupby(["camara", "seccion", "alianza"], sort=False).size()
+        for (camara, seccion, alianza), n in conteos.items():
+            resultado[camara].setdefault(seccion, {})[alianza] = int(n)
 
         return resultado
        
-    def obtener_secciones_por_alianza(self) -> dict[str, set[str]]:
+    def _calcular_secciones_por_alianza(self) -> dict[str, frozenset[str]]:
         resultado = {}
-        padron_keys = set(self.estructura["padron"].keys())
+        padron_keys = frozenset(self.estructura["padron"].keys())
 
         for alianza, datos in self.estructura["alianzas"].items():
             raw = datos.get("secciones", "Todas")
@@ -61,18 +71,23 @@ class Congreso:
             if raw is None or str(raw).strip().lower() == "todas":
                 resultado[alianza] = padron_keys
             else:
-                resultado[alianza] = set(map(str.strip, str(raw).split(",")))
+                resultado[alianza] = frozenset(map(str.strip, str(raw).split(",")))
 
         return resultado
 
+    def obtener_secciones_por_alianza(self) -> Mapping[str, frozenset[str]]:
+        """Secciones en las que compite cada alianza (vista de sólo lectura)."""
+        return self.secciones_por_alianza
+
     def obtener_bancas_por_seccion(self):
         return self.estructura["bancas_por_seccion"]
 
     def obtener_padron(self):
         return self.estructura["padron"]
     
-    def obtener_colores_alianzas(self):
-        return {a: v["color"] for a, v in self.estructura["alianzas"].items()}
+    def obtener_colores_alianzas(self) -> Mapping[str, str]:
+        """Color de cada alianza (vista de sólo lectura)."""
+        return self.colores_alianzas
 
     def obtener_composicion_actual(self):
         return self.composicion_actual
@@ -1,66 +1,120 @@
+import numpy as np
 import pandas as pd
 
-def repartir_bancas(df: pd.DataFrame) -> pd.DataFrame:
-    out = []
 
-    for seccion, grupo in df.groupby("seccion"):
-        total_votos = grupo["votos"].sum()
-        cargos      = grupo["cargos"].iloc[0]
-        cuociente   = max(1, total_votos // cargos)        # Asegura >= 1
+def _mejores(mascara: np.ndarray, residuo: np.ndarray, votos: np.ndarray,
+             n: int, ascendente: bool = False) -> np.ndarray:
+    """Índices de las ``n`` filas de ``mascara`` ordenadas por (residuo, votos)."""
+    idx = np.flatnonzero(mascara)
+    if ascendente:
+        orden = np.lexsort((votos[idx], residuo[idx]))
+    else:
+        orden = np.lexsort((-votos[idx], -residuo[idx]))
+    return idx[orden[:n]]
+
+
+def _repartir_seccion(votos: np.ndarray, cargos: int) -> np.ndarray:
+    """Cociente Hare + residuos para los votos de una sección."""
+    cuociente = max(1, int(votos.sum()) // cargos)        # Asegura >= 1
 
-        grupo = grupo.copy()
-        grupo["enteros"] = grupo["votos"] // cuociente
-        grupo["residuo"] = grupo["votos"] %  cuociente
-        grupo["bancas"]  = grupo["enteros"]
+    enteros = votos // cuociente
+    residuo = votos %  cuociente
+    bancas  = enteros.copy()
 
-        # Restos solo entre listas con >= 1 cuociente
-        faltan = cargos - grupo["bancas"].sum()
-        
+    # Restos solo entre listas con >= 1 cuociente
+    faltan = cargos - bancas.sum()
+    if faltan > 0:  # Solo asignar si realmente faltan bancas
+        bancas[_mejores(enteros > 0, residuo, votos, faltan)] += 1
+
+    # ── Art. 110: nadie alcanzó cuociente (con q == 1 sólo queda sin
+    # bancas una sección sin votos; se resuelve abajo).  Ir dividiendo el
+    # cuociente por 2 hasta que alguna lista lo alcance equivale a tomar
+    # el primer q = cuociente >> k que no supera a la más votada
+    if bancas.sum() == 0 and cuociente > 1:
+        k = (cuociente // (int(votos.max()) + 1)).bit_length()
+        q = max(1, cuociente >> k)
+        enteros = votos // q
+        residuo = votos %  q
+        bancas  = enteros.copy()
+
+        faltan = cargos - bancas.sum()
         if faltan > 0:  # Solo asignar si realmente faltan bancas
-            elig = grupo[grupo["enteros"] > 0]
-            if not elig.empty:
-                idx = (elig.sort_values(["residuo", "votos"],
-                                        ascending=False)
-                             .head(faltan).index)
-                grupo.loc[idx, "bancas"] += 1
-
-        # ── Art. 110: nadie alcanzó cuociente
-        if grupo["bancas"].sum() == 0:
-            q = cuociente
-            while grupo["bancas"].sum() == 0:
-                q = max(1, q // 2)
-                grupo["enteros"] = grupo["votos"] // q
-                grupo["residuo"] = grupo["votos"] %  q
-                grupo["bancas"]  = grupo["enteros"]
-
-                faltan = cargos - grupo["bancas"].sum()
-                
-                if faltan > 0:  # Solo asignar si realmente faltan bancas
-                    elig = grupo[grupo["enteros"] > 0]
-                    if not elig.empty:
-                        idx = (elig.sort_values(["residuo", "votos"],
-                                                ascending=False)
-                                       .head(faltan).index)
-                        grupo.loc[idx, "bancas"] += 1
-                elif faltan < 0:
-                    elig = grupo[grupo["bancas"] > 0]
-                    if not elig.empty:
-                        idx = (elig.sort_values(["residuo", "votos"],
-                                                ascending=True)
-                                       .head(-faltan).index)
-                        grupo.loc[idx, "bancas"] -= 1
-
-        # Completar con la lista más votada
-        faltan = cargos - grupo["bancas"].sum()
-        if faltan:
-            top = grupo["votos"].idxmax()
-            grupo.loc[top, "bancas"] += faltan
-
-        out.append(grupo[["seccion", "lista", "bancas"]])
-
-    # Concatenar resultados y ordenar
+            bancas[_mejores(enteros > 0, residuo, votos, faltan)] += 1
+        elif faltan < 0:
+            bancas[_mejores(bancas > 0, residuo, votos, -faltan, ascendente=True)] -= 1
+
+    # Completar con la lista más votada
+    faltan = cargos - bancas.sum()
+    if faltan:
+        bancas[votos.argmax()] += faltan
+
+    return bancas
+
+
+def _por_seccion(seccion: np.ndarray, valores: np.ndarray, n: int) -> np.ndarray:
+    """Suma de ``valores`` por código de sección."""
+    total = np.zeros(n, dtype=np.int64)
+    np.add.at(total, seccion, valores)
+    return total
+
+
+def _repartir_secciones(votos: np.ndarray, seccion: np.ndarray,
+                        cargos: np.ndarray) -> np.ndarray:
+    """Cociente Hare + residuos para todas las secciones a la vez.
+
+    ``seccion`` es el código (``0..n-1``) de la sección de cada fila y
+    ``cargos`` los cargos de cada sección.  Da lo mismo que aplicar
+    ``_repartir_seccion`` sección por sección: las pocas donde nadie
+    alcanza el cuociente (Art. 110) se resuelven justamente así.
+    """
+    n = len(cargos)
+
+    cuociente = np.maximum(1, _por_seccion(seccion, votos, n) // cargos)   # Asegura >= 1
+    q = cuociente[seccion]
+
+    enteros = votos // q
+    residuo = votos %  q
+    bancas  = enteros.copy()
+
+    # Restos solo entre listas con >= 1 cuociente (las demás, entre ellas
+    # las que no tienen votos, ni se ordenan): dentro de cada sección por
+    # (residuo, votos) y a igualdad por orden
+    faltan = cargos - _por_seccion(seccion, bancas, n)
+    elegibles = np.flatnonzero(enteros > 0)
+    orden  = elegibles[np.lexsort((-votos[elegibles], -residuo[elegibles], seccion[elegibles]))]
+    puesto = np.arange(len(orden)) - np.searchsorted(seccion[orden], seccion[orden])
+    bancas[orden[puesto < faltan[seccion[orden]]]] += 1
+
+    # ── Art. 110: nadie alcanzó cuociente
+    for s in np.flatnonzero((_por_seccion(seccion, bancas, n) == 0) & (cuociente > 1)):
+        filas_s = np.flatnonzero(seccion == s)
+        bancas[filas_s] = _repartir_seccion(votos[filas_s], int(cargos[s]))
+
+    # Completar con la lista más votada
+    faltan = cargos - _por_seccion(seccion, bancas, n)
+    if faltan.any():
+        orden = np.lexsort((-votos, seccion))
+        mas_votada = orden[np.searchsorted(seccion[orden], np.arange(n))]
+        incompletas = np.flatnonzero(faltan)
+        bancas[mas_votada[incompletas]] += faltan[incompletas]
+
+    return bancas
+
+
+def repartir_bancas(df: pd.DataFrame) -> pd.DataFrame:
+    votos  = df["votos"].to_numpy(dtype=np.int64)
+    seccion, secciones = pd.factorize(df["seccion"])
+
+    # Cargos de cada sección (iguales en todas sus filas)
+    cargos = np.empty(len(secciones), dtype=np.int64)
+    cargos[seccion] = df["cargos"].to_numpy(dtype=np.int64)
+
+    # Todas las secciones en una sola pasada vectorizada
+    bancas = _repartir_secciones(votos, seccion, cargos)
+
+    # Armar resultado y ordenar
     return (
-        pd.concat(out, ignore_index=True)        
-          .sort_values(["seccion", "lista"])      
-          .reset_index(drop=True)                
+        df[["seccion", "lista"]].assign(bancas=bancas)
+          .sort_values(["seccion", "lista"])
+          .reset_index(drop=True)
     )
@@ -1,8 +1,59 @@
+import threading
+import weakref
+from typing import Any, Callable, Hashable
+
 import geopandas as gpd
 
+# Resultados memorizados por (``id`` del arreglo de geometrías, clave);
+# cada entrada se libera junto con su arreglo.  No se usa un
+# WeakKeyDictionary porque los arreglos de pandas no son hashables.
+_MEMO: dict[tuple[int, Hashable], tuple[weakref.ref, Any]] = {}
+# RLock: el callback del weakref puede correr en el mismo hilo que ya lo tiene
+_MEMO_LOCK = threading.RLock()
+
+
+def _olvidar(memo: tuple[int, Hashable]) -> Callable[[weakref.ref], None]:
+    """Callback que borra ``memo`` sólo si sigue siendo de la ref finalizada.
+
+    Si el ``id`` ya se reutilizó para otro arreglo, la entrada nueva queda.
+    """
+    def _callback(ref: weakref.ref) -> None:
+        with _MEMO_LOCK:
+            if _MEMO.get(memo, (None, None))[0] is ref:
+                del _MEMO[memo]
+    return _callback
+
+
+def memorizar_por_geometrias(gdf: gpd.GeoDataFrame, clave: Hashable, calcular: Callable[[], Any]) -> Any:
+    """
+    Devuelve ``calcular()`` memorizado para las geometrías de ``gdf``.
+
+    Sirve para lo que depende sólo de la geometría (trazos, centroides):
+    mientras ``gdf`` conserve el mismo arreglo de geometrías se reutiliza
+    el resultado, que no debe modificarse.
+
+    Parameters:
+        gdf: GeoDataFrame cuyas geometrías identifican el resultado
+        clave: distingue cálculos distintos sobre las mismas geometrías
+        calcular: función sin argumentos que produce el resultado
+    """
+    geometrias = gdf.geometry.values
+    memo = (id(geometrias), clave)
+    with _MEMO_LOCK:
+        ref, valor = _MEMO.get(memo, (None, None))
+    if ref is None or ref() is not geometrias:
+        valor = calcular()
+        with _MEMO_LOCK:
+            _MEMO[memo] = (weakref.ref(geometrias, _olvidar(memo)), valor)
+    return valor
+
+
 def obtener_centroides_seguros(gdf: gpd.GeoDataFrame, epsg_proj: int = 22185) -> gpd.GeoSeries:
     """
     Calcula centroides geométricamente correctos para un GeoDataFrame con CRS geográfico.
+
+    Las dos reproyecciones se hacen una sola vez por arreglo de
+    geometrías y ``epsg_proj`` (ver ``memorizar_por_geometrias``).
     
     Parameters:
         gdf: GeoDataFrame original (puede estar en EPSG:4326 u otro)
@@ -11,8 +62,32 @@ def obtener_centroides_seguros(gdf: gpd.GeoDataFrame, epsg_proj: int = 22185) ->
     Returns:
         GeoSeries de centroides reproyectados al CRS original del gdf
     """
-    crs_original = gdf.crs
-    gdf_proj = gdf.to_crs(epsg=epsg_proj)
-    centroides_proj = gdf_proj.geometry.centroid
-    centroides_final = centroides_proj.to_crs(crs_original)
-    return centroides_final
+    def _calcular() -> gpd.GeoSeries:
+        crs_original = gdf.crs
+        gdf_proj = gdf.to_crs(epsg=epsg_proj)
+        centroides_proj = gdf_proj.geometry.centroid
+        return centroides_proj.to_crs(crs_original)
+
+    return memorizar_por_geometrias(gdf, ("centroides", epsg_proj), _calcular)
+
+
+def simplificar_geometrias(gdf: gpd.GeoDataFrame, tolerancia: float = 0.001) -> gpd.GeoDataFrame:
+    """
+    Devuelve una copia de ``gdf`` con las geometrías simplificadas.
+
+    Pensado para aplicarse una sola vez al cargar los polígonos: los
+    mapas se ven a escala provincial, donde el detalle original (cientos
+    de miles de vértices) queda muy por debajo de un píxel y sólo encarece
+    el dibujo.  La topología de cada polígono se preserva.
+
+    Parameters:
+        gdf: GeoDataFrame original
+        tolerancia: distancia máxima de desvío, en unidades del CRS de
+            ``gdf`` (en EPSG:4326, 0.001° ≈ 100 m)
+
+    Returns:
+        GeoDataFrame nuevo; ``gdf`` no se modifica
+    """
+    simplificado = gdf.copy()
+    simplificado.geometry = gdf.geometry.simplify(tolerancia, preserve_topology=True)
+    return simplificado
@@ -1,3 +1,5 @@
+import os
+import tempfile
 from pathlib import Path
 import geopandas as gpd
 
@@ -6,6 +8,20 @@ from functools import cache
 
 from utils.congreso import Congreso
 
+_BASE_DIR = Path(__file__).resolve().parents[1]
+
+
+@cache
+def _leer_config() -> configparser.ConfigParser:
+    """``config.ini`` del proyecto, parseado una sola vez por proceso.
+
+    Si el archivo no existe el parser queda vacío.  No debe modificarse:
+    lo comparten todos los que leen la configuración.
+    """
+    cfg = configparser.ConfigParser()
+    cfg.read(_BASE_DIR / "config.ini", encoding="utf-8")
+    return cfg
+
 
 @cache
 def cargar_congreso(anio: int | None = None) -> Congreso:
@@ -38,16 +54,12 @@ def cargar_congreso(anio: int | None = None) -> Congreso:
         Cuando la clave ``año_vigente`` falta o no es un entero válido
         dentro de ``config.ini``.
     """
-    base_dir = Path(__file__).resolve().parents[1]
-
     if anio is None:
-        config_path = base_dir / "config.ini"
-        if not config_path.exists():
+        if not (_BASE_DIR / "config.ini").exists():
             raise FileNotFoundError(
                 "No se encuentra config.ini y no se proporcionó año explícito."
             )
-        cfg = configparser.ConfigParser()
-        cfg.read(config_path, encoding="utf-8")
+        cfg = _leer_config()
         try:
             anio = int(cfg["simulador"]["año_vigente"])
         except (KeyError, ValueError):
@@ -55,7 +67,7 @@ def cargar_congreso(anio: int | None = None) -> Congreso:
                 "El archivo config.ini debe tener [simulador] y la clave 'año_vigente'."
             )
 
-    data_dir = base_dir / "data"
+    data_dir = _BASE_DIR / "data"
     json_path = data_dir / f"estructura_congreso_completa_{anio}.json"
     csv_path = data_dir / f"congreso_composicion_inicial_{anio}.csv"
 
@@ -81,16 +93,24 @@ def leer_epsg_proyectado(default: int = 22185) -> int:
         Código EPSG (entero) configurado en ``config.ini`` o el valor
         por defecto suministrado.
     """
-    cfg = configparser.ConfigParser()
-    base = Path(__file__).resolve().parents[1]
-    cfg.read(base / "config.ini", encoding="utf-8")
-    return int(cfg["simulador"].get("epsg_proj", default))
+    return int(_leer_config()["simulador"].get("epsg_proj", default))
 
 @cache
 def cargar_secciones_geojson(path: str | None = None) -> gpd.GeoDataFrame:
     """
     Carga (y cachea) el *GeoJSON* con los polígonos de secciones electorales.
 
+    La primera lectura guarda una copia *GeoParquet* junto al archivo
+    original (mismo nombre, extensión ``.parquet``); mientras esa copia
+    no sea más vieja que el GeoJSON se lee directamente de ella, evitando
+    parsear el JSON y reconstruir las geometrías en cada arranque.
+
+    Ojo: esto escribe en ``data/`` (o en el directorio de ``path``) en
+    tiempo de ejecución.  La copia se escribe en un temporal y se mueve
+    con :func:`os.replace`, así nunca queda a medio escribir; si aun así
+    no se puede leer, se vuelve al GeoJSON.  Si no se puede escribir (p. ej.
+    directorio de sólo lectura) simplemente no se guarda.
+
     Parameters
     ----------
     path : str | None, default ``None``
@@ -103,8 +123,33 @@ def cargar_secciones_geojson(path: str | None = None) -> gpd.GeoDataFrame:
         GeoDataFrame con las geometrías de cada sección.
     """
     if path is None:
-        base = Path(__file__).resolve().parents[1]
-        path = base / "data" / "secciones-electorales-pba.geojson"
+        path = _BASE_DIR / "data" / "secciones-electorales-pba.geojson"
 
-    gdf = gpd.read_file(path)
+    path = Path(path)
+    snapshot = path.with_suffix(".parquet")
+    if snapshot.exists() and snapshot.stat().st_mtime >= path.stat().st_mtime:
+        try:
+            return gpd.read_parquet(snapshot)
+        except Exception:
+            pass  # copia corrupta o ilegible: se vuelve a leer el GeoJSON
+
+    try:
+        # pyogrio lee todas las features de una vez (buffers Arrow) en
+        # lugar de iterar feature por feature como Fiona
+        gdf = gpd.read_file(path, engine="pyogrio", use_arrow=True)
+    except ImportError:
+        gdf = gpd.read_file(path)
+    tmp = None
+    try:
+        # temporal en el mismo directorio para que os.replace sea atómico
+        fd, tmp = tempfile.mkstemp(dir=snapshot.parent, suffix=".parquet.tmp")
+        os.close(fd)
+        gdf.to_parquet(tmp)
+        os.replace(tmp, snapshot)
+        tmp = None
+    except Exception:
+        pass  # p. ej. sólo lectura o fallo de pyarrow: se sigue con el GeoJSON
+    finally:
+        if tmp is not None:
+            Path(tmp).unlink(missing_ok=True)
     return gdf
@@ -1,17 +1,78 @@
 from typing import Mapping, Optional
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
+from matplotlib.axes import Axes
+from matplotlib.collections import PatchCollection
 from matplotlib.figure import Figure
 
-import matplotlib.pyplot as plt
-from matplotlib.patches import Patch
+from matplotlib.patches import Patch, PathPatch
+from matplotlib.path import Path
 import poli_sci_kit.plot as pk
 
-from utils.geotools import obtener_centroides_seguros
+from utils.geotools import memorizar_por_geometrias, obtener_centroides_seguros
 
 __all__ = ["mapa_bancas_ganadas", "mapa_diferencias_estatico", "mapa_ganadores", "crear_parlamento"]
 
 
+def _trazos(gdf: gpd.GeoDataFrame) -> list[Path]:
+    """Un ``Path`` compuesto por fila de ``gdf``, calculado una sola vez.
+
+    Los anillos salen de ``shapely.to_ragged_array`` sobre las geometrías
+    normalizadas (mismo sentido de giro que usa geopandas para distinguir
+    huecos), así que todos los mapas comparten el mismo trazado y sólo
+    cambian los colores.
+    """
+    def _calcular() -> list[Path]:
+        _, coords, offsets = shapely.to_ragged_array(
+            shapely.normalize(np.asarray(gdf.geometry.values)), include_z=False
+        )
+        anillos = offsets[0]
+        codigos = np.full(len(coords), Path.LINETO, dtype=Path.code_type)
+        codigos[anillos[:-1]] = Path.MOVETO
+        codigos[anillos[1:] - 1] = Path.CLOSEPOLY
+
+        # Límites de cada geometría en ``coords``, bajando nivel por nivel
+        limites = offsets[-1]
+        for nivel in reversed(offsets[:-1]):
+            limites = nivel[limites]
+
+        return [Path(coords[i:j], codigos[i:j]) for i, j in zip(limites[:-1], limites[1:])]
+
+    return memorizar_por_geometrias(gdf, "trazos", _calcular)
+
+
+def _por_seccion(gdf: gpd.GeoDataFrame, valores: pd.Series, relleno) -> np.ndarray:
+    """``valores`` (indexados por sección) en el orden de las filas de ``gdf``."""
+    return valores.reindex(gdf["seccion"].to_numpy()).fillna(relleno).to_numpy()
+
+
+def _dibujar_secciones(ax: Axes, gdf: gpd.GeoDataFrame, valores=None, cmap=None,
+                       vmin=None, vmax=None, **estilo) -> PatchCollection:
+    """Dibuja todas las secciones de ``gdf`` como una única colección.
+
+    Equivale a ``gdf.plot(ax=ax, ...)`` (mismo aspecto y límites) pero
+    reutiliza los trazos de ``_trazos``.  Con ``valores`` los colores
+    salen de ``cmap``; si no, de ``facecolor`` en ``estilo``.
+    """
+    if gdf.crs and gdf.crs.is_geographic:
+        _, ymin, _, ymax = gdf.total_bounds
+        ax.set_aspect(1 / np.cos(np.mean([ymin, ymax]) * np.pi / 180))
+    else:
+        ax.set_aspect("equal")
+
+    coleccion = PatchCollection([PathPatch(t) for t in _trazos(gdf)], **estilo)
+    if valores is not None:
+        coleccion.set_cmap(cmap)
+        coleccion.set_array(np.asarray(valores))
+        coleccion.set_clim(vmin, vmax)
+
+    ax.add_collection(coleccion)
+    ax.autoscale_view()
+    return coleccion
+
+
 def mapa_bancas_ganadas(gdf_secciones: gpd.GeoDataFrame,
     bancas_ganadas_df: pd.DataFrame,
     alianza: str,
@@ -21,14 +82,14 @@ def mapa_bancas_ganadas(gdf_secciones: gpd.GeoDataFrame,
     ) -> Figure:
     """Crea un mapa estático de bancas ganadas por alianza."""
     if ax is None:
-        fig, ax = plt.subplots(figsize=(10, 8))
+        fig = Figure(figsize=(10, 8))
+        ax = fig.add_subplot()
     else:
         fig = ax.get_figure()
     
-    gdf_plot = gdf_secciones.copy()
-    gdf_plot["bancas"] = gdf_plot["seccion"].map(bancas_ganadas_df[alianza]).fillna(0)
+    bancas = _por_seccion(gdf_secciones, bancas_ganadas_df[alianza], 0)
     
-    vmax = gdf_plot["bancas"].max()
+    vmax = bancas.max()
     if vmax == 0:
         ax.text(0.5, 0.5, "No hay bancas ganadas para mostrar", transform=ax.transAxes, 
                 ha='center', va='center', fontsize=12)
@@ -37,35 +98,33 @@ def mapa_bancas_ganadas(gdf_secciones: gpd.GeoDataFrame,
         ax.set_title(titulo)
         return fig
     
-    gdf_plot.plot(
-        column="bancas",
+    coleccion = _dibujar_secciones(
+        ax, gdf_secciones, bancas,
         cmap="Blues",
         vmin=0,
         vmax=vmax,
-        ax=ax,
-        legend=True,
-        legend_kwds={'label': 'Bancas ganadas', 'shrink': 0.8},
         edgecolor='black',
         linewidth=0.5
     )
+    fig.colorbar(coleccion, ax=ax, label='Bancas ganadas', shrink=0.8)
 
-    centroides = obtener_centroides_seguros(gdf_plot, epsg_proj)
+    centroides = obtener_centroides_seguros(gdf_secciones, epsg_proj)
 
-    for idx, row in gdf_plot.iterrows():
-        if row["bancas"] > 0:
-            centroide = centroides.iloc[idx]
-            ax.annotate(
-                f'{int(row["bancas"])}',
-                (centroide.x, centroide.y),
-                ha='center', va='center',
-                fontsize=9, fontweight='bold',
-                color='white',
-                bbox=dict(boxstyle="round,pad=0.2", facecolor='navy', alpha=0.8)
-            )
+    con_bancas = bancas > 0
+    for x, y, n in zip(centroides.x.to_numpy()[con_bancas],
+                       centroides.y.to_numpy()[con_bancas],
+                       bancas[con_bancas]):
+        ax.annotate(
+            f'{int(n)}',
+            (x, y),
+            ha='center', va='center',
+            fontsize=9, fontweight='bold',
+            color='white',
+            bbox=dict(boxstyle="round,pad=0.2", facecolor='navy', alpha=0.8)
+        )
     
     ax.set_title(titulo, fontsize=14, fontweight='bold')
     ax.set_axis_off()
-    plt.close(fig)
     return fig
 
 
@@ -78,14 +137,14 @@ def mapa_diferencias_estatico(gdf_secciones: gpd.GeoDataFrame,
     ) -> Figure:
     """Crea un mapa estático de diferencias de bancas por alianza."""
     if ax is None:
-        fig, ax = plt.subplots(figsize=(10, 8))
+        fig = Figure(figsize=(10, 8))
+        ax = fig.add_subplot()
     else:
         fig = ax.get_figure()
     
-    gdf_plot = gdf_secciones.copy()
-    gdf_plot["ganancia"] = gdf_plot["seccion"].map(cambios_df[alianza]).fillna(0)
+    ganancia = _por_seccion(gdf_secciones, cambios_df[alianza], 0)
     
-    vmax = gdf_plot["ganancia"].abs().max()
+    vmax = np.abs(ganancia).max()
     if vmax == 0:
         ax.text(0.5, 0.5, "No hay cambios para mostrar", transform=ax.transAxes, 
                 ha='center', va='center', fontsize=12)
@@ -94,32 +153,30 @@ def mapa_diferencias_estatico(gdf_secciones: gpd.GeoDataFrame,
         ax.set_title(titulo)
         return fig
     
-    gdf_plot.plot(
-        column="ganancia",
+    coleccion = _dibujar_secciones(
+        ax, gdf_secciones, ganancia,
         cmap="RdYlGn",
         vmin=-vmax,
-        vmax=vmax,
-        ax=ax,
-        legend=True,
-        legend_kwds={'label': 'Ganancia de bancas', 'shrink': 0.8}
+        vmax=vmax
     )
+    fig.colorbar(coleccion, ax=ax, label='Ganancia de bancas', shrink=0.8)
 
-    centroides = obtener_centroides_seguros(gdf_plot, epsg_proj=epsg_proj)
+    centroides = obtener_centroides_seguros(gdf_secciones, epsg_proj=epsg_proj)
 
-    for idx, row in gdf_plot.iterrows():
-        if abs(row["ganancia"]) > 0:
-            centroide = centroides.iloc[idx]
-            ax.annotate(
-                f'{int(row["ganancia"]):+d}',
-                (centroide.x, centroide.y),
-                ha='center', va='center',
-                fontsize=8, fontweight='bold',
-                bbox=dict(boxstyle="round,pad=0.2", facecolor='white', alpha=0.8)
-            )
+    con_cambios = ganancia != 0
+    for x, y, n in zip(centroides.x.to_numpy()[con_cambios],
+                       centroides.y.to_numpy()[con_cambios],
+                       ganancia[con_cambios]):
+        ax.annotate(
+            f'{int(n):+d}',
+            (x, y),
+            ha='center', va='center',
+            fontsize=8, fontweight='bold',
+            bbox=dict(boxstyle="round,pad=0.2", facecolor='white', alpha=0.8)
+        )
     
     ax.set_title(titulo, fontsize=14, fontweight='bold')
     ax.set_axis_off()
-    plt.close(fig)
     return fig
 
 
@@ -132,55 +189,52 @@ def mapa_ganadores(gdf_secciones: gpd.GeoDataFrame,
     ) -> Figure:
     """Crea un mapa mostrando el partido ganador por sección."""
     if ax is None:
-        fig, ax = plt.subplots(figsize=(10, 8))
+        fig = Figure(figsize=(10, 8))
+        ax = fig.add_subplot()
     else:
         fig = ax.get_figure()
     
-    ganadores = bancas_totales_df.idxmax(axis=1)
-    max_bancas = bancas_totales_df.max(axis=1)
+    # Ganador y sus bancas con un solo argmax por fila
+    bancas = bancas_totales_df.to_numpy()
+    mejor = bancas.argmax(axis=1)
+    ganadores = pd.Series(bancas_totales_df.columns.to_numpy()[mejor], index=bancas_totales_df.index)
+    max_bancas = pd.Series(bancas[np.arange(len(bancas)), mejor], index=bancas_totales_df.index)
     
-    gdf_plot = gdf_secciones.copy()
-    gdf_plot["ganador"] = gdf_plot["seccion"].map(ganadores).fillna("Sin datos")
-    gdf_plot["max_bancas"] = gdf_plot["seccion"].map(max_bancas).fillna(0)
+    ganador_seccion = _por_seccion(gdf_secciones, ganadores, "Sin datos")
+    max_bancas = _por_seccion(gdf_secciones, max_bancas, 0)
     
-    gdf_plot.plot(
-        color="#F0F0F0", 
-        ax=ax,
+    # Una sola colección: cada sección con el color de su ganador
+    _dibujar_secciones(
+        ax, gdf_secciones,
+        facecolor=[
+            "#F0F0F0" if ganador == "Sin datos" else colores_partidos.get(ganador, "#CCCCCC")
+            for ganador in ganador_seccion
+        ],
         edgecolor='black',
         linewidth=0.5
     )
-    
-    for ganador in gdf_plot["ganador"].unique():
-        if ganador != "Sin datos":
-            subset = gdf_plot[gdf_plot["ganador"] == ganador]
-            subset.plot(
-                color=colores_partidos.get(ganador, "#CCCCCC"),
-                ax=ax,
-                label=ganador,
-                edgecolor='black',
-                linewidth=0.5
-            )
-
-    centroides = obtener_centroides_seguros(gdf_plot, epsg_proj=epsg_proj)
-
-    for idx, row in gdf_plot.iterrows():
-        if row["max_bancas"] > 0:
-            centroide = centroides.iloc[idx]
-            ax.annotate(
-                f'{int(row["max_bancas"])}',
-                (centroide.x, centroide.y),
-                ha='center', va='center',
-                fontsize=9, fontweight='bold',
-                color='white',
-                bbox=dict(boxstyle="round,pad=0.2", facecolor='black', alpha=0.7)
-            )
+
+    centroides = obtener_centroides_seguros(gdf_secciones, epsg_proj=epsg_proj)
+
+    con_bancas = max_bancas > 0
+    for x, y, n in zip(centroides.x.to_numpy()[con_bancas],
+                       centroides.y.to_numpy()[con_bancas],
+                       max_bancas[con_bancas]):
+        ax.annotate(
+            f'{int(n)}',
+            (x, y),
+            ha='center', va='center',
+            fontsize=9, fontweight='bold',
+            color='white',
+            bbox=dict(boxstyle="round,pad=0.2", facecolor='black', alpha=0.7)
+        )
     
     ax.set_title(titulo, fontsize=14, fontweight='bold')
     ax.set_axis_off()
     
     # Construir leyenda manualmente
     legend_elements = []
-    for ganador in gdf_plot["ganador"].unique():
+    for ganador in pd.unique(ganador_seccion):
         if ganador != "Sin datos":
             color = colores_partidos.get(ganador, "#CCCCCC")
             legend_elements.append(Patch(facecolor=color, edgecolor='black', label=ganador))
@@ -188,14 +242,14 @@ def mapa_ganadores(gdf_secciones: gpd.GeoDataFrame,
     if legend_elements:
         ax.legend(handles=legend_elements, loc='upper left', bbox_to_anchor=(1, 1))
     
-    plt.close(fig)
     return fig
 
 def crear_parlamento(series, titulo, colores: Mapping[str, str]) -> Optional[Figure]:
     series = series[series > 0].sort_values(ascending=False)
     if series.empty:
         return None
-    fig, ax = plt.subplots(figsize=(8, 4.5))
+    fig = Figure(figsize=(8, 4.5))
+    ax = fig.add_subplot()
     pk.parliament(
         allocations=series.tolist(),
         labels=series.index.tolist(),
@@ -212,6 +266,5 @@ def crear_parlamento(series, titulo, colores: Mapping[str, str]) -> Optional[Fig
     ax.legend(loc='upper center', bbox_to_anchor=(0.5, -0.1),
               ncol=3, frameon=False)
     
-    plt.close(fig)
     return fig
 
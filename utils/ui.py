@@ -1,8 +1,10 @@
+import numpy as np
 import pandas as pd
 import streamlit as st
 from utils import plots
 
 import geopandas as gpd
+from matplotlib.figure import Figure
 
 __all__ = [
     "configurar_sidebar",
@@ -14,7 +16,13 @@ __all__ = [
 
 def configurar_sidebar(alianzas_globales: list[str], alianzas_recomendadas: list[str], 
                       secciones_x_alianza: dict, padron_real: dict) -> tuple[list[str], dict]:
-    """Configura el sidebar y retorna las alianzas visibles y la configuración."""
+    """Configura el sidebar y retorna las alianzas visibles y la configuración.
+
+    Los sliders quedan dentro de un ``st.form``: moverlos no dispara un
+    rerun hasta que se presiona «Ejecutar cálculo».  Los widgets que
+    cambian la estructura del sidebar (alianzas, secciones) quedan fuera
+    para que respondan en el momento.
+    """
     sidebar = st.sidebar
     sidebar.header("⚙️ Configuración Electoral")
 
@@ -25,36 +33,47 @@ def configurar_sidebar(alianzas_globales: list[str], alianzas_recomendadas: list
         default=[a for a in alianzas_recomendadas if a in alianzas_globales]
     )
 
-    # Advertencias por alianzas que no compiten en todas las secciones
-    for alianza in alianzas_visibles:
-        secciones = secciones_x_alianza.get(alianza, set())
-        if set(secciones) != set(padron_real.keys()):
-            sidebar.info(f"⚠️ '{alianza}' no compite en todas las secciones.")
+    # Advertencia (una sola) por alianzas que no compiten en todas las
+    # secciones; la vista de claves del padrón se compara como conjunto
+    parciales = [
+        f"'{alianza}'" for alianza in alianzas_visibles
+        if secciones_x_alianza.get(alianza, set()) != padron_real.keys()
+    ]
+    if parciales:
+        sidebar.info(f"⚠️ No compiten en todas las secciones: {', '.join(parciales)}.")
 
     # Configuración por sección
     cfg_seccion = sidebar.checkbox("🗺️ Configuración por sección")
+    secciones_personalizadas = sidebar.multiselect(
+        "Secciones a personalizar",
+        list(padron_real.keys()),
+    ) if cfg_seccion else []
+
+    form = sidebar.form("configuracion")
 
     # Parámetros electorales
-    sidebar.subheader("Parámetros electorales")
-    participacion = sidebar.slider("Participación (%)", 40, 85, 60) / 100
-    votos_validos_pct = sidebar.slider("Votos válidos (%)", 80, 98, 90) / 100
+    form.subheader("Parámetros electorales")
+    participacion = form.slider("Participación (%)", 40, 85, 60) / 100
+    votos_validos_pct = form.slider("Votos válidos (%)", 80, 98, 90) / 100
 
     return alianzas_visibles, {
         'cfg_seccion': cfg_seccion,
+        'secciones_personalizadas': secciones_personalizadas,
         'participacion': participacion,
-        'votos_validos_pct': votos_validos_pct
+        'votos_validos_pct': votos_validos_pct,
+        'form': form
     }
 
 
-def configurar_intenciones_voto(alianzas_visibles: list[str], cfg_seccion: bool, 
-                               padron_real: dict, secciones_x_alianza: dict) -> tuple[dict, dict]:
-    """Configura las intenciones de voto globales y por sección."""
-    sidebar = st.sidebar
-    sidebar.subheader("Intención de voto (%)")
+def configurar_intenciones_voto(alianzas_visibles: list[str], selecciones: list[str],
+                               secciones_x_alianza: dict, form) -> tuple[dict, dict]:
+    """Configura, dentro de ``form``, las intenciones de voto globales y
+    de las secciones ``selecciones``."""
+    form.subheader("Intención de voto (%)")
 
     # Sliders globales
     sliders = {}
-    cols = sidebar.columns(2)
+    cols = form.columns(2)
 
     for i, alianza in enumerate(alianzas_visibles):
         col = cols[i % 2]
@@ -70,22 +89,17 @@ def configurar_intenciones_voto(alianzas_visibles: list[str], cfg_seccion: bool,
     # Validación del total
     total_pct = sum(sliders.values())
     if total_pct != 100:
-        sidebar.warning(f"Total {total_pct}% (debe sumar 100)")
+        form.warning(f"Total {total_pct}% (debe sumar 100)")
     else:
-        sidebar.success("Total 100% ✅")
+        form.success("Total 100% ✅")
 
     creencias_global = sliders
     creencias_por_seccion = {"global": creencias_global}
 
     # Configuración por sección
-    if cfg_seccion:
-        sidebar.markdown("---")
-        sidebar.subheader("📍 Por sección")
-
-        selecciones = sidebar.multiselect(
-            "Secciones a personalizar",
-            list(padron_real.keys()),
-        )
+    if selecciones:
+        form.markdown("---")
+        form.subheader("📍 Por sección")
 
         for sec in selecciones:
             alianzas_en_seccion = [
@@ -94,7 +108,7 @@ def configurar_intenciones_voto(alianzas_visibles: list[str], cfg_seccion: bool,
             ]
             alianzas_en_seccion.sort(key=lambda x: x not in alianzas_visibles)
             
-            with sidebar.expander(sec):
+            with form.expander(sec):
                 sliders_sec = {}
                 cols = st.columns(2)
                 for i, alianza in enumerate(alianzas_en_seccion):
@@ -111,11 +125,9 @@ def configurar_intenciones_voto(alianzas_visibles: list[str], cfg_seccion: bool,
     return creencias_global, creencias_por_seccion
 
 
-def renderizar_boton_ejecutar(total_pct: int) -> bool:
-    """Renderiza el botón de ejecución y retorna si fue presionado."""
-    sidebar = st.sidebar
-    
-    if sidebar.button("🚀 Ejecutar cálculo", type="primary"):
+def renderizar_boton_ejecutar(total_pct: int, form) -> bool:
+    """Renderiza el botón que envía ``form`` y retorna si fue presionado."""
+    if form.form_submit_button("🚀 Ejecutar cálculo", type="primary"):
         if total_pct != 100:
             st.error("❌ Los porcentajes deben sumar 100%.")
             st.stop()
@@ -124,40 +136,166 @@ def renderizar_boton_ejecutar(total_pct: int) -> bool:
     return False
 
 
+def _bancas_por_seccion(nuevas: pd.DataFrame) -> pd.DataFrame:
+    """Tabla sección × alianza con las bancas nuevas.
+
+    Se arma como matriz densa a partir de los códigos de sección y lista,
+    sin pasar por el ``groupby(...).unstack()`` con MultiIndex.
+    """
+    filas, secciones = pd.factorize(nuevas["seccion"], sort=True)
+    columnas, listas = pd.factorize(nuevas["lista"], sort=True)
+
+    tabla = np.zeros((len(secciones), len(listas)), dtype=np.int64)
+    np.add.at(tabla, (filas, columnas), nuevas["bancas"].to_numpy(dtype=np.int64))
+    return pd.DataFrame(tabla,
+                        index=pd.Index(secciones, name="seccion"),
+                        columns=pd.Index(listas, name="lista"))
+
+
+def _alinear_a(nuevas: pd.DataFrame, tabla: pd.DataFrame) -> np.ndarray:
+    """Matriz sección × alianza con los ejes de ``nuevas`` (faltantes en 0)."""
+    return tabla.reindex(index=nuevas.index, columns=nuevas.columns, fill_value=0).to_numpy(dtype=np.int64)
+
+
+def _diferencia_por_seccion(nuevas: pd.DataFrame, camara: str, ctx: dict) -> pd.DataFrame:
+    """Variación de bancas por sección respecto de la composición actual."""
+    # 1) Bancas NO renovadas (seguras S)
+    seguras = _alinear_a(nuevas, ctx["SEGURAS"][camara])
+
+    # 2) Composición completa ANTES de la elección
+    viejas = _alinear_a(nuevas, ctx["VIEJAS"][camara])
+
+    # 3) Totales nuevos y variación
+    return pd.DataFrame(nuevas.to_numpy() + seguras - viejas,
+                        index=nuevas.index, columns=nuevas.columns)
+
+
+def _bancas_totales(nuevas: pd.DataFrame, camara: str, ctx: dict) -> pd.DataFrame:
+    """Bancas totales por sección (nuevas + no renovadas)."""
+    return (nuevas + _alinear_a(nuevas, ctx["SEGURAS"][camara])).astype(int)
+
+
+def _sin_columnas_vacias(tabla: pd.DataFrame) -> pd.DataFrame:
+    """Descarta las alianzas sin valores distintos de cero."""
+    return tabla.loc[:, (tabla != 0).any(axis=0)]
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _precalcular_tablas(detalles_por_seccion: tuple[pd.DataFrame, pd.DataFrame],
+                        _ctx: dict) -> dict[str, pd.DataFrame]:
+    """Tablas sección × alianza que usan los tabs, calculadas una sola vez.
+
+    Devuelve las bancas ganadas y la variación (sin alianzas en cero),
+    y los totales con bancas no renovadas, para cada cámara.  Queda
+    cacheada entre reruns; ``_ctx`` no entra en la clave porque es
+    constante durante toda la sesión.
+    """
+    tablas = {}
+    for prefijo, camara, nuevas in zip(("dip", "sen"), ("diputados", "senadores"), detalles_por_seccion):
+        por_seccion = _bancas_por_seccion(nuevas)
+        tablas[f"{prefijo}_ganadas"] = _sin_columnas_vacias(por_seccion)
+        tablas[f"{prefijo}_cambio"] = _sin_columnas_vacias(_diferencia_por_seccion(por_seccion, camara, _ctx))
+        tablas[f"{prefijo}_totales"] = _bancas_totales(por_seccion, camara, _ctx)
+    return tablas
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _parlamento(bancas: pd.Series, titulo: str, _colores: dict) -> Figure | None:
+    """``plots.crear_parlamento`` cacheado por composición de la cámara.
+
+    ``_colores`` no entra en la clave: es fijo durante toda la sesión.
+    """
+    return plots.crear_parlamento(bancas, titulo, _colores)
+
+
+def _firma(tabla: pd.DataFrame, *extra) -> tuple:
+    """Identifica el contenido de ``tabla`` (más ``extra``) para comparar entre reruns."""
+    return (*extra, tuple(tabla.columns),
+            pd.util.hash_pandas_object(tabla).to_numpy().tobytes())
+
+
+def _figura_mapa(clave: str, firma: tuple, dibujar) -> Figure:
+    """Figura del mapa ``clave``, redibujada sólo si cambió ``firma``.
+
+    Las figuras se guardan por sesión junto con la firma de lo que
+    muestran; en un rerun con los mismos datos se devuelve la figura ya
+    dibujada.  Se construyen con ``Figure`` (sin pasar por ``pyplot``),
+    así que no quedan registradas en el gestor de figuras ni hace falta
+    cerrarlas.  ``dibujar`` recibe el eje limpio donde trazar el mapa.
+    """
+    figuras = st.session_state.setdefault("_figuras_mapas", {})
+    guardada = figuras.get(clave)
+    if guardada is not None and guardada[0] == firma:
+        return guardada[1]
+
+    fig = Figure(figsize=(10, 8)) if guardada is None else guardada[1]
+    fig.clear()
+    dibujar(fig.add_subplot())
+    figuras[clave] = (firma, fig)
+    return fig
+
+
+@st.fragment
+def _mapa_por_alianza(dibujar, gdf_secciones: gpd.GeoDataFrame, tabla: pd.DataFrame,
+                      camara: str, clave: str, titulo: str, epsg_proj: int) -> None:
+    """Selector de alianza y su mapa.
+
+    Es un fragmento: al elegir otra alianza sólo se vuelve a ejecutar
+    este bloque, no todo ``mostrar_resultados``.  ``titulo`` puede
+    incluir ``{alianza}``.
+    """
+    alianza = st.selectbox(
+        f"Elegí alianza ({camara}):",
+        list(tabla.columns),
+        index=0,
+        key=clave
+    )
+
+    titulo = titulo.format(alianza=alianza)
+    fig = _figura_mapa(
+        clave, _firma(tabla, alianza, titulo),
+        lambda ax: dibujar(gdf_secciones, tabla, alianza, titulo,
+                           ax=ax, epsg_proj=epsg_proj)
+    )
+    st.pyplot(fig, use_container_width=True)
+
+
 def mostrar_resultados(
     dip_final: pd.Series,
     sen_final: pd.Series,
     *,
     ctx: dict,
+    participacion: float,
+    votos_validos_pct: float,
     gdf_secciones: gpd.GeoDataFrame | None = None,
+    tablas_resumen: tuple[pd.DataFrame, pd.DataFrame],
     detalles_por_seccion: tuple[pd.DataFrame, pd.DataFrame] | None = None,
 ):
-    """Pinta métricas, tablas y gráficos en tabs."""
+    """Pinta métricas, tablas y gráficos en tabs.
+
+    ``participacion`` y ``votos_validos_pct`` son los parámetros con los
+    que se calcularon los resultados.  ``tablas_resumen`` son las tablas
+    «alianza → Bancas» (sólo alianzas con bancas) ya armadas al guardar
+    los resultados.
+    """
     # Extraer variables del contexto
     colores_partidos = ctx["COLORES_PARTIDOS"]
-    bancas_no_renuevan = ctx["BANCAS_NO_RENUEVAN"]
-    participacion = st.session_state.get("resultados", {}).get("participacion", 0.6)
-    votos_validos_pct = st.session_state.get("resultados", {}).get("votos_validos_pct", 0.9)
-    padron_real = ctx["PADRON_REAL"]
+    padron_total = ctx["PADRON_TOTAL"]
     epsg_proj = ctx["EPSG_PROJ"]
+    tablas = None if detalles_por_seccion is None else _precalcular_tablas(detalles_por_seccion, ctx)
     
-    tabs = ["📊 Bancas Ganadas", "🏛️ Parlamentos", "📋 Detalles"]
-    tab_objs = st.tabs(tabs)
+    tab_bancas, tab_parlamentos, tab_detalles = st.tabs(
+        ["📊 Bancas Ganadas", "🏛️ Parlamentos", "📋 Detalles"]
+    )
 
     # Bancas Ganadas
-    with tab_objs[0]:
+    with tab_bancas:
         st.subheader("📊 Bancas ganadas por sección")
         
-        if detalles_por_seccion is not None:
-            dip_nuevas, sen_nuevas = detalles_por_seccion
-            
-            # Tablas de bancas ganadas por sección
-            dip_ganadas = dip_nuevas.groupby(["seccion", "lista"]).bancas.sum().unstack(fill_value=0)
-            sen_ganadas = sen_nuevas.groupby(["seccion", "lista"]).bancas.sum().unstack(fill_value=0)
-
-            # No mostrar tablas vacías
-            dip_ganadas = dip_ganadas.loc[:, (dip_ganadas != 0).any(axis=0)]
-            sen_ganadas = sen_ganadas.loc[:, (sen_ganadas != 0).any(axis=0)]
+        if tablas is not None:
+            # Tablas de bancas ganadas por sección (sin alianzas en cero)
+            dip_ganadas = tablas["dip_ganadas"]
+            sen_ganadas = tablas["sen_ganadas"]
             
             col_table1, col_table2 = st.columns(2)
             with col_table1:
@@ -182,22 +320,22 @@ def mostrar_resultados(
                 _renderizar_mapas_bancas_ganadas(gdf_secciones, dip_ganadas, sen_ganadas, colores_partidos, epsg_proj)
 
     # Parlamentos
-    with tab_objs[1]:
+    with tab_parlamentos:
         st.subheader("🏛️ Parlamento provincial 2025 – 2027")
         c1, c2 = st.columns(2)
         with c1:
-            fig1 = plots.crear_parlamento(dip_final, "Diputados", colores_partidos)
+            fig1 = _parlamento(dip_final, "Diputados", colores_partidos)
             if fig1:
                 st.pyplot(fig1)
         with c2:
-            fig2 = plots.crear_parlamento(sen_final, "Senadores", colores_partidos)
+            fig2 = _parlamento(sen_final, "Senadores", colores_partidos)
             if fig2:
                 st.pyplot(fig2)
 
     # Detalles
-    with tab_objs[2]:
-        _renderizar_tab_detalles(dip_final, sen_final, padron_real, participacion, 
-                                votos_validos_pct, detalles_por_seccion, ctx, gdf_secciones, epsg_proj)
+    with tab_detalles:
+        _renderizar_tab_detalles(*tablas_resumen, padron_total, participacion, 
+                                votos_validos_pct, tablas, colores_partidos, gdf_secciones, epsg_proj)
 
 
 def _renderizar_mapas_bancas_ganadas(gdf_secciones: gpd.GeoDataFrame, dip_ganadas: pd.DataFrame, 
@@ -215,37 +353,15 @@ def _renderizar_mapas_bancas_ganadas(gdf_secciones: gpd.GeoDataFrame, dip_ganada
         
         with col_dip:
             st.markdown("**Diputados**")
-            alianzas_disponibles_dip = list(dip_ganadas.columns)
-            alianza_dip = st.selectbox(
-                "Elegí alianza (Diputados):",
-                alianzas_disponibles_dip,
-                index=0,
-                key="dip_ganadas"
-            )
-            
-            fig_dip = plots.mapa_bancas_ganadas(
-                gdf_secciones, dip_ganadas, alianza_dip,
-                f"Bancas ganadas - {alianza_dip} (Diputados)",
-                epsg_proj=epsg_proj
-            )
-            st.pyplot(fig_dip, use_container_width=True)
+            _mapa_por_alianza(plots.mapa_bancas_ganadas, gdf_secciones, dip_ganadas,
+                              "Diputados", "dip_ganadas",
+                              "Bancas ganadas - {alianza} (Diputados)", epsg_proj)
         
         with col_sen:
             st.markdown("**Senadores**")
-            alianzas_disponibles_sen = list(sen_ganadas.columns)
-            alianza_sen = st.selectbox(
-                "Elegí alianza (Senadores):",
-                alianzas_disponibles_sen,
-                index=0,
-                key="sen_ganadas"
-            )
-            
-            fig_sen = plots.mapa_bancas_ganadas(
-                gdf_secciones, sen_ganadas, alianza_sen,
-                f"Bancas ganadas - {alianza_sen} (Senadores)",
-                epsg_proj=epsg_proj
-            )
-            st.pyplot(fig_sen, use_container_width=True)
+            _mapa_por_alianza(plots.mapa_bancas_ganadas, gdf_secciones, sen_ganadas,
+                              "Senadores", "sen_ganadas",
+                              "Bancas ganadas - {alianza} (Senadores)", epsg_proj)
     
     with tab_ganador_sec:
         st.markdown("#### Quién ganó más bancas por sección")
@@ -254,98 +370,65 @@ def _renderizar_mapas_bancas_ganadas(gdf_secciones: gpd.GeoDataFrame, dip_ganada
         
         with col_dip_g:
             st.markdown("**Diputados - Quién ganó más bancas**")
-            fig_dip_ganador = plots.mapa_ganadores(
-                gdf_secciones, dip_ganadas, colores_partidos,
-                "Partido con más bancas nuevas - Diputados",
-                epsg_proj=epsg_proj
+            fig_dip_ganador = _figura_mapa(
+                "dip_ganador_nuevas", _firma(dip_ganadas, "Partido con más bancas nuevas - Diputados"),
+                lambda ax: plots.mapa_ganadores(
+                    gdf_secciones, dip_ganadas, colores_partidos,
+                    "Partido con más bancas nuevas - Diputados",
+                    ax=ax, epsg_proj=epsg_proj
+                )
             )
             st.pyplot(fig_dip_ganador, use_container_width=True)
         
         with col_sen_g:
             st.markdown("**Senadores - Quién ganó más bancas**")
-            fig_sen_ganador = plots.mapa_ganadores(
-                gdf_secciones, sen_ganadas, colores_partidos,
-                "Partido con más bancas nuevas - Senadores",
-                epsg_proj=epsg_proj
+            fig_sen_ganador = _figura_mapa(
+                "sen_ganador_nuevas", _firma(sen_ganadas, "Partido con más bancas nuevas - Senadores"),
+                lambda ax: plots.mapa_ganadores(
+                    gdf_secciones, sen_ganadas, colores_partidos,
+                    "Partido con más bancas nuevas - Senadores",
+                    ax=ax, epsg_proj=epsg_proj
+                )
             )
             st.pyplot(fig_sen_ganador, use_container_width=True)
 
 
-def _renderizar_tab_detalles(dip_final: pd.Series, sen_final: pd.Series,
-                           padron_real: dict, participacion: float, votos_validos_pct: float,
-                           detalles_por_seccion: tuple[pd.DataFrame, pd.DataFrame] | None,
-                           ctx: dict, gdf_secciones: gpd.GeoDataFrame | None, epsg_proj: int) -> None:
+def _renderizar_tab_detalles(dip_tabla: pd.DataFrame, sen_tabla: pd.DataFrame,
+                           padron_total: int, participacion: float, votos_validos_pct: float,
+                           tablas: dict[str, pd.DataFrame] | None, colores_partidos: dict,
+                           gdf_secciones: gpd.GeoDataFrame | None, epsg_proj: int) -> None:
     """Renderiza el tab de detalles."""
 
     st.subheader("📊 Resumen de bancas")
     col1, col2 = st.columns(2)
     with col1:
         st.markdown("#### Diputados")
-        st.dataframe(dip_final[dip_final > 0].rename("Bancas"))
-        # st.dataframe(dip_final.rename("Bancas"))
+        st.dataframe(dip_tabla)
     with col2:
         st.markdown("#### Senadores")
-        st.dataframe(sen_final[sen_final > 0].rename("Bancas"))
-        # st.dataframe(sen_final.rename("Bancas"))
+        st.dataframe(sen_tabla)
     
     st.markdown("---")
    
     st.subheader("📋 Parámetros y métricas")
     col_param1, col_param2, col_param3 = st.columns(3)
     with col_param1:
-        st.metric("Padrón total", f"{sum(padron_real.values()):,}")
+        st.metric("Padrón total", f"{padron_total:,}")
     with col_param2:
         st.metric("Participación", f"{participacion:.1%}")
     with col_param3:
         st.metric("Votos válidos", f"{votos_validos_pct:.1%}")
     
-    if detalles_por_seccion is not None:
-        _renderizar_diferencias_por_seccion(detalles_por_seccion, ctx, gdf_secciones, epsg_proj)
+    if tablas is not None:
+        _renderizar_diferencias_por_seccion(tablas, colores_partidos, gdf_secciones, epsg_proj)
 
 
-def _renderizar_diferencias_por_seccion(detalles_por_seccion: tuple[pd.DataFrame, pd.DataFrame],
-                                       ctx: dict, gdf_secciones: gpd.GeoDataFrame | None, epsg_proj: int) -> None:
+def _renderizar_diferencias_por_seccion(tablas: dict[str, pd.DataFrame], colores_partidos: dict,
+                                       gdf_secciones: gpd.GeoDataFrame | None, epsg_proj: int) -> None:
     """Renderiza las diferencias por sección."""
-    dip_nuevas, sen_nuevas = detalles_por_seccion
-    bancas_no_renuevan = ctx["BANCAS_NO_RENUEVAN"]
-    colores_partidos = ctx["COLORES_PARTIDOS"]
-    
-    def diferencia_por_seccion(df_nuevo, camara):
-        def map_alianzas(dic):
-            m = ctx["CONGRESO"].partido_a_alianza
-            return {m.get(p.strip().upper(), p): n for p, n in dic.items()}
-
-        # 1) Nuevas bancas
-        nuevas = (df_nuevo
-                .groupby(["seccion", "lista"]).bancas
-                .sum()
-                .unstack(fill_value=0))
-
-        # 2) Bancas NO renovadas (seguras S)
-        seguras = (pd.DataFrame({sec: map_alianzas(dic)
-                                for sec, dic in bancas_no_renuevan[camara].items()})
-                .T.reindex_like(nuevas)
-                .fillna(0)
-                .astype(int))
-
-        # 3) Composición completa ANTES de la elección
-        viejas = (pd.DataFrame({sec: map_alianzas(dic)
-                                for sec, dic in ctx["CONGRESO"]
-                                .composicion_actual[camara].items()})
-                .T.reindex_like(nuevas)
-                .fillna(0)
-                .astype(int))
-
-        # 4) Totales nuevos y variación
-        nuevas_totales = nuevas + seguras
-        return (nuevas_totales - viejas).astype(int)
-
-    dip_cambio = diferencia_por_seccion(dip_nuevas, "diputados")
-    sen_cambio = diferencia_por_seccion(sen_nuevas, "senadores")
-
-    # NO mostrar tablas vacías
-    dip_cambio = dip_cambio.loc[:, (dip_cambio != 0).any(axis=0)]
-    sen_cambio = sen_cambio.loc[:, (sen_cambio != 0).any(axis=0)]
+    # Variación por sección (sin alianzas en cero)
+    dip_cambio = tablas["dip_cambio"]
+    sen_cambio = tablas["sen_cambio"]
 
     # Tablas de diferencias
     st.markdown("### 📊 Ganancia/Pérdida por Sección")
@@ -362,13 +445,13 @@ def _renderizar_diferencias_por_seccion(detalles_por_seccion: tuple[pd.DataFrame
     # Mapas de diferencias
     if gdf_secciones is not None and not dip_cambio.empty:
         _renderizar_mapas_diferencias(gdf_secciones, dip_cambio, sen_cambio, colores_partidos,
-                                    dip_nuevas, sen_nuevas, bancas_no_renuevan, ctx, epsg_proj)
+                                    tablas["dip_totales"], tablas["sen_totales"], epsg_proj)
 
 
 def _renderizar_mapas_diferencias(gdf_secciones: gpd.GeoDataFrame, dip_cambio: pd.DataFrame,
                                 sen_cambio: pd.DataFrame, colores_partidos: dict,
-                                dip_nuevas: pd.DataFrame, sen_nuevas: pd.DataFrame,
-                                bancas_no_renuevan: dict, ctx: dict, epsg_proj: int) -> None:
+                                dip_totales: pd.DataFrame, sen_totales: pd.DataFrame,
+                                epsg_proj: int) -> None:
     """Renderiza los mapas de diferencias."""
     st.markdown("### 🗺️ Mapas de diferencias por alianza")
 
@@ -381,78 +464,41 @@ def _renderizar_mapas_diferencias(gdf_secciones: gpd.GeoDataFrame, dip_cambio: p
         
         with col_dip:
             st.markdown("**Diputados**")
-            alianzas_disponibles = list(dip_cambio.columns)
-            alianza_dip = st.selectbox(
-                "Elegí alianza (Diputados):",
-                alianzas_disponibles,
-                index=0,
-                key="dip_diferencias_detalles"
-            )
-            
-            fig_dip = plots.mapa_diferencias_estatico(
-                gdf_secciones, dip_cambio, alianza_dip,
-                f"Diferencia de bancas - {alianza_dip}",
-                epsg_proj=epsg_proj
-            )
-            st.pyplot(fig_dip, use_container_width=True)
+            _mapa_por_alianza(plots.mapa_diferencias_estatico, gdf_secciones, dip_cambio,
+                              "Diputados", "dip_diferencias_detalles",
+                              "Diferencia de bancas - {alianza}", epsg_proj)
         
         with col_sen:
             st.markdown("**Senadores**")
-            alianzas_disponibles_sen = list(sen_cambio.columns)
-            alianza_sen = st.selectbox(
-                "Elegí alianza (Senadores):",
-                alianzas_disponibles_sen,
-                index=0,
-                key="sen_diferencias_detalles"
-            )
-            
-            fig_sen = plots.mapa_diferencias_estatico(
-                gdf_secciones, sen_cambio, alianza_sen,
-                f"Diferencia de bancas - {alianza_sen}",
-                epsg_proj=epsg_proj
-            )
-            st.pyplot(fig_sen, use_container_width=True)
+            _mapa_por_alianza(plots.mapa_diferencias_estatico, gdf_secciones, sen_cambio,
+                              "Senadores", "sen_diferencias_detalles",
+                              "Diferencia de bancas - {alianza}", epsg_proj)
     
     with tab_ganador:
         st.markdown("#### Mapas de partidos ganadores por sección")
         
-        # Calcular bancas totales (nuevas + no renovadas)
-        def calcular_bancas_totales(df_nuevas, bancas_no_renuevan, camara):
-            def mapear_alianzas(dic):
-                mapeo = ctx["CONGRESO"].partido_a_alianza
-                salida = {}
-                for partido, n in dic.items():
-                    alianza = mapeo.get(partido.strip().upper(), partido)
-                    salida[alianza] = salida.get(alianza, 0) + n
-                return salida
-
-            nuevas = df_nuevas.groupby(["seccion", "lista"]).bancas.sum().unstack(fill_value=0)
-            viejas = pd.DataFrame({
-                sec: mapear_alianzas(dic)
-                for sec, dic in bancas_no_renuevan[camara].items()
-            }).T.fillna(0).astype(int)
-            viejas = viejas.reindex(index=nuevas.index, columns=nuevas.columns, fill_value=0)
-            return (nuevas + viejas).astype(int)
-        
-        dip_totales = calcular_bancas_totales(dip_nuevas, bancas_no_renuevan, "diputados")
-        sen_totales = calcular_bancas_totales(sen_nuevas, bancas_no_renuevan, "senadores")
-        
         col_dip_g, col_sen_g = st.columns(2)
         
         with col_dip_g:
             st.markdown("**Diputados - Quién ganó más bancas**")
-            fig_dip_ganador = plots.mapa_ganadores(
-                gdf_secciones, dip_totales, colores_partidos,
-                "Partido con más bancas - Diputados",
-                epsg_proj=epsg_proj
+            fig_dip_ganador = _figura_mapa(
+                "dip_ganador_totales", _firma(dip_totales, "Partido con más bancas - Diputados"),
+                lambda ax: plots.mapa_ganadores(
+                    gdf_secciones, dip_totales, colores_partidos,
+                    "Partido con más bancas - Diputados",
+                    ax=ax, epsg_proj=epsg_proj
+                )
             )
             st.pyplot(fig_dip_ganador, use_container_width=True)
         
         with col_sen_g:
             st.markdown("**Senadores - Quién ganó más bancas**")
-            fig_sen_ganador = plots.mapa_ganadores(
-                gdf_secciones, sen_totales, colores_partidos,
-                "Partido con más bancas - Senadores",
-                epsg_proj=epsg_proj
+            fig_sen_ganador = _figura_mapa(
+                "sen_ganador_totales", _firma(sen_totales, "Partido con más bancas - Senadores"),
+                lambda ax: plots.mapa_ganadores(
+                    gdf_secciones, sen_totales, colores_partidos,
+                    "Partido con más bancas - Senadores",
+                    ax=ax, epsg_proj=epsg_proj
+                )
             )
             st.pyplot(fig_sen_ganador, use_container_width=True)
\ No newline at end of file